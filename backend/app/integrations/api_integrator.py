@@ -12,8 +12,56 @@ import pandas as pd
 from typing import Dict, List, Optional, Any
 import asyncio
 import aiohttp
+import copy
+import functools
+import inspect
+import time
+import weakref
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
+def async_ttl_cache(ttl: float = 300.0, maxsize: int = 256):
+    """
+    Memoize a coroutine function's results per argument tuple for ttl seconds,
+    keeping at most maxsize entries (least recently used evicted first).
+    Failure values - empty results or dicts carrying an 'error' key - are not
+    cached, and every caller gets its own copy of a cached result. Methods get
+    one cache per instance, held weakly so it doesn't keep the instance alive.
+    """
+    def decorator(func):
+        is_method = next(iter(inspect.signature(func).parameters), None) == 'self'
+        instance_caches = weakref.WeakKeyDictionary()  # self -> OrderedDict, for methods
+        shared_cache = OrderedDict()  # key -> (expires_at, result), for plain functions
+        
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if is_method:
+                cache = instance_caches.setdefault(args[0], OrderedDict())
+                key = (args[1:], tuple(sorted(kwargs.items())))
+            else:
+                cache = shared_cache
+                key = (args, tuple(sorted(kwargs.items())))
+            entry = cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                cache.move_to_end(key)
+                return copy.deepcopy(entry[1])
+            
+            result = await func(*args, **kwargs)
+            if result and 'error' not in result:
+                cache[key] = (time.monotonic() + ttl, copy.deepcopy(result))
+                cache.move_to_end(key)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return result
+        
+        def cache_clear():
+            shared_cache.clear()
+            instance_caches.clear()
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
 class FinancialCrimeAPIIntegrator:
     """
     Integration class for various financial crime detection APIs
@@ -54,6 +102,7 @@ class FinancialCrimeAPIIntegrator:
             }
         }
     
+    @async_ttl_cache(ttl=300)
     async def check_sanctions_lists(self, entity_name: str, entity_type: str = 'individual') -> Dict[str, Any]:
         """
         Check entity against multiple sanctions lists
@@ -76,8 +125,14 @@ class FinancialCrimeAPIIntegrator:
         
         # Simulate API calls (in production, these would be real API calls)
         try:
+            # Query OFAC SDN, World Bank and RBI/FIU India lists concurrently
+            ofac_result, wb_result, rbi_result = await asyncio.gather(
+                self._check_ofac_sdn(entity_name),
+                self._check_worldbank_sanctions(entity_name, entity_type),
+                self._check_rbi_sanctions(entity_name)
+            )
+            
             # OFAC SDN List check
-            ofac_result = await self._check_ofac_sdn(entity_name)
             if ofac_result['match']:
                 results['sanctions_found'] = True
                 results['sources'].append('OFAC_SDN')
@@ -85,7 +140,6 @@ class FinancialCrimeAPIIntegrator:
                 results['details'].append(ofac_result)
             
             # World Bank sanctions check
-            wb_result = await self._check_worldbank_sanctions(entity_name, entity_type)
             if wb_result['match']:
                 results['sanctions_found'] = True
                 results['sources'].append('WORLD_BANK')
@@ -93,7 +147,6 @@ class FinancialCrimeAPIIntegrator:
                 results['details'].append(wb_result)
             
             # RBI/FIU India check
-            rbi_result = await self._check_rbi_sanctions(entity_name)
             if rbi_result['match']:
                 results['sanctions_found'] = True
                 results['sources'].append('RBI_INDIA')
@@ -207,6 +260,7 @@ class PublicDataAPIs:
     """
     
     @staticmethod
+    @async_ttl_cache(ttl=300)
     async def get_currency_exchange_rates(base_currency: str = 'INR') -> Dict[str, float]:
         """
         Get current exchange rates for detecting unusual currency conversions
@@ -223,6 +277,7 @@ class PublicDataAPIs:
             return {}
     
     @staticmethod
+    @async_ttl_cache(ttl=300)
     async def get_ip_geolocation(ip_address: str) -> Dict[str, Any]:
         """
         Get geolocation data for IP address to detect location anomalies
@@ -253,13 +308,39 @@ class PublicDataAPIs:
         }
 
 # Example usage and testing functions
-async def test_api_integrations():
-    """Test the API integrations"""
+async def test_api_integrations(live: bool = False):
+    """
+    Test the API integrations. The public exchange-rate and IP geolocation APIs
+    are only called with live=True, so the default run needs no network.
+    """
     api_integrator = FinancialCrimeAPIIntegrator()
     
+    if live:
+        # Run the sanctions check and public API lookups concurrently; one failure doesn't cancel the rest
+        sanctions_result, exchange_rates, ip_location = await asyncio.gather(
+            api_integrator.check_sanctions_lists("Suspicious Entity Ltd", "organization"),
+            PublicDataAPIs.get_currency_exchange_rates('INR'),
+            PublicDataAPIs.get_ip_geolocation('8.8.8.8'),
+            return_exceptions=True
+        )
+    else:
+        sanctions_result = await api_integrator.check_sanctions_lists("Suspicious Entity Ltd", "organization")
+    
     # Test sanctions check
-    sanctions_result = await api_integrator.check_sanctions_lists("Suspicious Entity Ltd", "organization")
-    print("Sanctions Check Result:", json.dumps(sanctions_result, indent=2))
+    print("Sanctions Check Result:", json.dumps(sanctions_result, indent=2, default=str))
+    
+    # Test public data APIs
+    if not live:
+        print("\nPublic data APIs skipped (run with --live to call them)")
+    else:
+        if isinstance(exchange_rates, Exception) or not exchange_rates:
+            print(f"\nExchange rates unavailable: {exchange_rates}")
+        else:
+            print(f"\nFetched {len(exchange_rates)} INR exchange rates")
+        if isinstance(ip_location, Exception) or not ip_location:
+            print(f"IP geolocation unavailable: {ip_location}")
+        else:
+            print("IP Geolocation:", json.dumps(ip_location, indent=2))
     
     # Test real-time data fetch
     transaction_data = api_integrator.get_real_time_transaction_data("HDFC", 7)
@@ -271,4 +352,8 @@ async def test_api_integrations():
     print("\nFraud Indicators:", json.dumps(fraud_indicators, indent=2))
 
 if __name__ == "__main__":
-    asyncio.run(test_api_integrations())
+    import argparse
+    parser = argparse.ArgumentParser(description="Test the API integrations")
+    parser.add_argument("--live", action="store_true",
+                        help="also call the public exchange-rate and IP geolocation APIs")
+    asyncio.run(test_api_integrations(live=parser.parse_args().live))
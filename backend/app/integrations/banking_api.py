@@ -39,13 +39,22 @@ class IndianBankingAPIIntegrator:
     Integration with major Indian banks for real-time transaction monitoring
     """
     
-    def __init__(self):
+    def __init__(self, auth_cache_ttl: int = 300):
         self.connections = {}
         self.session_cache = {}
         self.rate_limits = {}
+        self.bank_names = {}
+        self.supported_endpoints = {}
+        self.auth_cache_ttl = auth_cache_ttl  # seconds to reuse a successful authentication
         
         # Initialize bank connections (these would be real credentials in production)
         self._initialize_bank_connections()
+        
+        # Per-field lookups kept alongside connections for status reporting
+        for bank_code, bank in self.connections.items():
+            self.bank_names[bank_code] = bank.bank_name
+            self.rate_limits[bank_code] = bank.rate_limit
+            self.supported_endpoints[bank_code] = bank.supported_endpoints
     
     def _initialize_bank_connections(self):
         """Initialize connections to major Indian banks"""
@@ -123,21 +132,34 @@ class IndianBankingAPIIntegrator:
         if bank_code not in self.connections:
             raise ValueError(f"Bank {bank_code} not configured")
         
+        # Reuse a recent successful authentication instead of re-authenticating
+        cached = self.session_cache.get(bank_code)
+        if cached and cached['expires_at'] > datetime.now():
+            return cached['auth']
+        
         bank = self.connections[bank_code]
         
         try:
             if bank.authentication_type == 'oauth':
-                return await self._oauth_authenticate(bank)
+                auth_result = await self._oauth_authenticate(bank)
             elif bank.authentication_type == 'api_key':
-                return await self._api_key_authenticate(bank)
+                auth_result = await self._api_key_authenticate(bank)
             elif bank.authentication_type == 'certificate':
-                return await self._certificate_authenticate(bank)
+                auth_result = await self._certificate_authenticate(bank)
             else:
                 raise ValueError(f"Unsupported authentication type: {bank.authentication_type}")
                 
         except Exception as e:
             logger.error(f"Authentication failed for {bank_code}: {str(e)}")
             return {'error': str(e), 'authenticated': False}
+        
+        if auth_result.get('authenticated'):
+            self.session_cache[bank_code] = {
+                'auth': auth_result,
+                'expires_at': datetime.now() + timedelta(seconds=self.auth_cache_ttl)
+            }
+        
+        return auth_result
     
     async def _oauth_authenticate(self, bank: BankConnection) -> Dict[str, Any]:
         """OAuth 2.0 authentication for banks like SBI, Axis"""
@@ -1,18 +1,56 @@
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi import FastAPI, File, UploadFile, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
 import pandas as pd
 import asyncio
+import numpy as np
+import orjson
 from datetime import datetime
+from functools import lru_cache
 from app.model.predictor import predict_single, predict_batch
-from app.integrations.banking_api import IndianBankingAPIIntegrator
-from app.analytics.advanced_analytics import AdvancedFinancialAnalytics
+
+def _orjson_default(obj):
+    """Fallback for values orjson can't encode natively: pandas timestamps and numpy scalars"""
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _join_tuple_keys(obj):
+    """Recursively join tuple dict keys (from multi-aggregation groupby stats) into 'amount_mean'-style strings"""
+    if isinstance(obj, dict):
+        return {
+            '_'.join(map(str, key)) if isinstance(key, tuple) else key: _join_tuple_keys(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_join_tuple_keys(value) for value in obj]
+    return obj
+
+class NumpyORJSONResponse(Response):
+    """
+    JSON response rendered with orjson, serializing numpy scalars/arrays and non-string
+    dict keys. It is the app-wide default, but FastAPI still runs jsonable_encoder on
+    plain dict return values first, so endpoints with numpy-heavy payloads return it
+    explicitly to skip that pass.
+    """
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
 
 app = FastAPI(
     title="Police Financial Crime Investigation API",
     description="AI-powered fraud detection system for law enforcement agencies to analyze suspicious financial transactions",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=NumpyORJSONResponse
 )
 
 app.add_middleware(
@@ -80,25 +118,55 @@ def upload_csv(file: UploadFile = File(...)):
     """
     return predict_batch(file)
 
-# Initialize integration modules
-banking_integrator = IndianBankingAPIIntegrator()
-analytics_engine = AdvancedFinancialAnalytics()
+# Integration modules are created on first use so workers don't pay their import cost at startup
+@lru_cache(maxsize=1)
+def get_banking_integrator():
+    """Shared banking API integrator, created on first request"""
+    from app.integrations.banking_api import IndianBankingAPIIntegrator
+    return IndianBankingAPIIntegrator()
+
+@lru_cache(maxsize=1)
+def get_analytics_engine():
+    """Shared analytics engine, created on first request"""
+    from app.analytics.advanced_analytics import AdvancedFinancialAnalytics
+    return AdvancedFinancialAnalytics()
+
+def _read_transactions_csv(contents: bytes) -> pd.DataFrame:
+    """
+    Parse an uploaded transactions CSV, converting timestamps with an explicit ISO 8601
+    format. Other formats fall back to pandas' inference, which parses or raises -
+    unparseable values are never silently dropped.
+    """
+    df = pd.read_csv(pd.io.common.StringIO(contents.decode('utf-8')))
+    if 'timestamp' in df.columns:
+        try:
+            df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601')
+        except (ValueError, TypeError):
+            df['timestamp'] = pd.to_datetime(df['timestamp'])
+    return df
 
 # New Banking API Integration Endpoints
 
 @app.get("/banking/status")
-async def banking_integration_status():
+async def banking_integration_status(banking_integrator=Depends(get_banking_integrator)):
     """Check status of banking API integrations"""
     try:
-        status = {}
-        for bank_code in banking_integrator.connections.keys():
-            auth_result = await banking_integrator.authenticate_bank(bank_code)
-            status[bank_code] = {
-                'name': banking_integrator.connections[bank_code].bank_name,
-                'authenticated': auth_result.get('authenticated', False),
-                'rate_limit': banking_integrator.connections[bank_code].rate_limit,
-                'endpoints': banking_integrator.connections[bank_code].supported_endpoints
+        # Authenticate with all banks concurrently
+        bank_codes = list(banking_integrator.connections.keys())
+        auth_results = await asyncio.gather(
+            *[banking_integrator.authenticate_bank(bank_code) for bank_code in bank_codes],
+            return_exceptions=True
+        )
+        
+        status = {
+            bank_code: {
+                'name': banking_integrator.bank_names[bank_code],
+                'authenticated': not isinstance(auth_result, Exception) and auth_result.get('authenticated', False),
+                'rate_limit': banking_integrator.rate_limits[bank_code],
+                'endpoints': banking_integrator.supported_endpoints[bank_code]
             }
+            for bank_code, auth_result in zip(bank_codes, auth_results)
+        }
         
         return {
             'banking_api_status': 'operational',
@@ -113,7 +181,8 @@ async def banking_integration_status():
 async def get_bank_transactions(
     bank_code: str,
     hours_back: Optional[int] = 1,
-    min_amount: Optional[float] = None
+    min_amount: Optional[float] = None,
+    banking_integrator=Depends(get_banking_integrator)
 ):
     """Fetch real-time transactions from specific bank"""
     try:
@@ -127,7 +196,7 @@ async def get_bank_transactions(
             amount_threshold=min_amount
         )
         
-        return {
+        return NumpyORJSONResponse({
             'bank_code': bank_code,
             'transaction_count': len(transactions_df),
             'time_range': {
@@ -141,12 +210,12 @@ async def get_bank_transactions(
                 'max_amount': transactions_df['amount'].max(),
                 'high_risk_count': len(transactions_df[transactions_df['amount'] > 500000])
             }
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch transactions from {bank_code}: {str(e)}")
 
 @app.post("/banking/alerts/{bank_code}")
-async def setup_fraud_alerts(bank_code: str, alert_rules: Dict[str, Any]):
+async def setup_fraud_alerts(bank_code: str, alert_rules: Dict[str, Any], banking_integrator=Depends(get_banking_integrator)):
     """Setup real-time fraud alerts for specific bank"""
     try:
         alert_setup = await banking_integrator.setup_fraud_alerts(bank_code, alert_rules)
@@ -159,7 +228,7 @@ async def setup_fraud_alerts(bank_code: str, alert_rules: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=f"Failed to setup alerts for {bank_code}: {str(e)}")
 
 @app.get("/banking/account/{bank_code}/{account_number}")
-async def investigate_account(bank_code: str, account_number: str):
+async def investigate_account(bank_code: str, account_number: str, banking_integrator=Depends(get_banking_integrator)):
     """Get detailed account information for investigation"""
     try:
         account_details = await banking_integrator.get_account_details(bank_code, account_number)
@@ -179,12 +248,12 @@ async def investigate_account(bank_code: str, account_number: str):
 # Advanced Analytics Endpoints
 
 @app.post("/analytics/comprehensive")
-async def comprehensive_analytics(file: UploadFile = File(...)):
+async def comprehensive_analytics(file: UploadFile = File(...), analytics_engine=Depends(get_analytics_engine)):
     """Run comprehensive analytics on uploaded transaction data"""
     try:
         # Read uploaded CSV
         contents = await file.read()
-        df = pd.read_csv(pd.io.common.StringIO(contents.decode('utf-8')))
+        df = _read_transactions_csv(contents)
         
         # Add timestamp if not present
         if 'timestamp' not in df.columns:
@@ -201,47 +270,47 @@ async def comprehensive_analytics(file: UploadFile = File(...)):
                     'summary': result.summary,
                     'risk_level': result.summary.get('risk_level', 'UNKNOWN'),
                     'recommendations': result.recommendations[:3],  # Top 3 recommendations
-                    'key_findings': result.detailed_results
+                    'key_findings': _join_tuple_keys(result.detailed_results)
                 }
         
-        return {
+        return NumpyORJSONResponse({
             'analysis_id': f"ANALYTICS_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
             'executive_summary': results.get('executive_summary', {}),
             'analysis_results': formatted_results,
             'total_transactions': len(df),
             'timestamp': datetime.now().isoformat()
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analytics processing failed: {str(e)}")
 
 @app.post("/analytics/network")
-async def network_analysis(file: UploadFile = File(...)):
+async def network_analysis(file: UploadFile = File(...), analytics_engine=Depends(get_analytics_engine)):
     """Perform network analysis to identify suspect connections"""
     try:
         contents = await file.read()
-        df = pd.read_csv(pd.io.common.StringIO(contents.decode('utf-8')))
+        df = _read_transactions_csv(contents)
         
         result = analytics_engine.network_analysis(df)
         
-        return {
+        return NumpyORJSONResponse({
             'analysis_type': 'network_analysis',
             'summary': result.summary,
             'suspicious_entities': result.detailed_results.get('suspicious_nodes', [])[:10],
             'communities_detected': len(result.detailed_results.get('communities', [])),
             'recommendations': result.recommendations,
             'timestamp': datetime.now().isoformat()
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Network analysis failed: {str(e)}")
 
 @app.post("/analytics/temporal")
-async def temporal_analysis(file: UploadFile = File(...)):
+async def temporal_analysis(file: UploadFile = File(...), analytics_engine=Depends(get_analytics_engine)):
     """Analyze temporal patterns in transaction data"""
     try:
         contents = await file.read()
-        df = pd.read_csv(pd.io.common.StringIO(contents.decode('utf-8')))
+        df = _read_transactions_csv(contents)
         
         # Add timestamp if not present
         if 'timestamp' not in df.columns:
@@ -249,66 +318,66 @@ async def temporal_analysis(file: UploadFile = File(...)):
         
         result = analytics_engine.temporal_pattern_analysis(df)
         
-        return {
+        return NumpyORJSONResponse({
             'analysis_type': 'temporal_analysis',
             'summary': result.summary,
             'unusual_patterns': result.detailed_results.get('anomalies', []),
-            'hourly_stats': result.detailed_results.get('hourly_stats', {}),
+            'hourly_stats': _join_tuple_keys(result.detailed_results.get('hourly_stats', {})),
             'recommendations': result.recommendations,
             'timestamp': datetime.now().isoformat()
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Temporal analysis failed: {str(e)}")
 
 @app.post("/analytics/geographic")
-async def geographic_analysis(file: UploadFile = File(...)):
+async def geographic_analysis(file: UploadFile = File(...), analytics_engine=Depends(get_analytics_engine)):
     """Analyze geographic patterns and clustering"""
     try:
         contents = await file.read()
-        df = pd.read_csv(pd.io.common.StringIO(contents.decode('utf-8')))
+        df = _read_transactions_csv(contents)
         
         result = analytics_engine.geographic_clustering_analysis(df)
         
-        return {
+        return NumpyORJSONResponse({
             'analysis_type': 'geographic_analysis',
             'summary': result.summary,
             'location_anomalies': result.detailed_results.get('geographic_anomalies', []),
             'high_risk_locations': result.detailed_results.get('high_risk_transactions', [])[:20],
             'recommendations': result.recommendations,
             'timestamp': datetime.now().isoformat()
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Geographic analysis failed: {str(e)}")
 
 @app.post("/analytics/behavioral")
-async def behavioral_analysis(file: UploadFile = File(...)):
+async def behavioral_analysis(file: UploadFile = File(...), analytics_engine=Depends(get_analytics_engine)):
     """Perform behavioral profiling analysis"""
     try:
         contents = await file.read()
-        df = pd.read_csv(pd.io.common.StringIO(contents.decode('utf-8')))
+        df = _read_transactions_csv(contents)
         
         result = analytics_engine.behavioral_profiling(df)
         
-        return {
+        return NumpyORJSONResponse({
             'analysis_type': 'behavioral_analysis',
             'summary': result.summary,
             'suspicious_customers': result.detailed_results.get('suspicious_customers', [])[:10],
             'behavioral_alerts': result.detailed_results.get('behavioral_alerts', []),
             'recommendations': result.recommendations,
             'timestamp': datetime.now().isoformat()
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Behavioral analysis failed: {str(e)}")
 
 @app.post("/analytics/predictive")
-async def predictive_modeling(file: UploadFile = File(...)):
+async def predictive_modeling(file: UploadFile = File(...), analytics_engine=Depends(get_analytics_engine)):
     """Generate predictive risk scores and forecasts"""
     try:
         contents = await file.read()
-        df = pd.read_csv(pd.io.common.StringIO(contents.decode('utf-8')))
+        df = _read_transactions_csv(contents)
         
         # Add timestamp if not present
         if 'timestamp' not in df.columns:
@@ -316,7 +385,7 @@ async def predictive_modeling(file: UploadFile = File(...)):
         
         result = analytics_engine.predictive_risk_modeling(df)
         
-        return {
+        return NumpyORJSONResponse({
             'analysis_type': 'predictive_modeling',
             'summary': result.summary,
             'high_risk_predictions': result.detailed_results.get('high_risk_transactions', [])[:20],
@@ -324,14 +393,14 @@ async def predictive_modeling(file: UploadFile = File(...)):
             'model_metrics': result.detailed_results.get('model_metrics', {}),
             'recommendations': result.recommendations,
             'timestamp': datetime.now().isoformat()
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Predictive modeling failed: {str(e)}")
 
 # Multi-bank monitoring endpoint
 @app.post("/banking/monitor/start")
-async def start_multi_bank_monitoring(duration_minutes: int = 60):
+async def start_multi_bank_monitoring(duration_minutes: int = 60, banking_integrator=Depends(get_banking_integrator)):
     """Start monitoring all connected banks simultaneously"""
     try:
         
@@ -1,17 +1,32 @@
 # Quick test script for FastAPI endpoints
+import asyncio
+import io
+import os
+
+import pandas as pd
 from fastapi.testclient import TestClient
 from app.main import app
+from app.model.predictor import CSV_READ_OPTS, is_input_column, predict_batch, predict_single
 
 client = TestClient(app)
 
+TEST_DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "tests", "data")
+TEST_FILES = ["test_sample_transactions.csv", "test_suspicious_transactions.csv"]
+
+# Fixed scoring cases, built once at import
+MODEL_CASES = (
+    {"name": "Small UPI payment", "data": {"Amount": 1500, "Payment_Method": "UPI", "Merchant_Category": "Food", "Location": "Mumbai"}},
+    {"name": "High value RTGS", "data": {"Amount": 950000, "Payment_Method": "RTGS", "Merchant_Category": "Others", "Location": "Delhi"}},
+    {"name": "Card entertainment", "data": {"Amount": 75000, "Payment_Method": "Card", "Merchant_Category": "Entertainment", "Location": "Goa"}},
+    {"name": "Small NEFT bill", "data": {"Amount": 250, "Payment_Method": "NEFT", "Merchant_Category": "Utilities", "Location": "Chennai"}},
+)
+
 def test_predict():
     data = {"amount": 100, "time": 12345}
     response = client.post("/predict", json=data)
     print("/predict response:", response.json())
 
 def test_upload():
-    import io
-    import pandas as pd
     df = pd.DataFrame({"amount": [100, 200], "time": [12345, 23456]})
     csv_bytes = io.StringIO()
     df.to_csv(csv_bytes, index=False)
@@ -20,6 +35,37 @@ def test_upload():
     response = client.post("/upload", files=files)
     print("/upload response:", response.json())
 
+def test_model_predictions():
+    # Score every case in one model call
+    result = predict_batch(pd.DataFrame([case["data"] for case in MODEL_CASES]))
+    if "error" in result:
+        # Fall back to one call per case so a failure can be traced to its row
+        print("predict_batch failed:", result["error"])
+        for case in MODEL_CASES:
+            print(f"{case['name']}:", predict_single(case["data"]))
+        return
+    for case, prediction in zip(MODEL_CASES, result["results"]):
+        print(f"{case['name']}: fraud={prediction['is_fraud']} probability={prediction['probability']:.3f}")
+
+def _process_one(file_name):
+    df = pd.read_csv(os.path.join(TEST_DATA_DIR, file_name), usecols=is_input_column, **CSV_READ_OPTS)
+    return {"file": file_name, "rows": len(df), "result": predict_batch(df)}
+
+async def _process_files(file_names):
+    # Files are independent, so read and score them on worker threads side by side
+    return await asyncio.gather(*[asyncio.to_thread(_process_one, name) for name in file_names])
+
+def test_batch_processing():
+    for processed in asyncio.run(_process_files(TEST_FILES)):
+        result = processed["result"]
+        if "error" in result:
+            print(f"{processed['file']}: predict_batch failed:", result["error"])
+            continue
+        summary = result["summary"]
+        print(f"{processed['file']}: {summary['fraudulent']}/{summary['total']} flagged of {processed['rows']} rows")
+
 if __name__ == "__main__":
     test_predict()
     test_upload()
+    test_model_predictions()
+    test_batch_processing()
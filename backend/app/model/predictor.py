@@ -11,6 +11,27 @@ PAYMENT_ENCODER_PATH = "app/model/payment_encoder.pkl"
 MERCHANT_ENCODER_PATH = "app/model/merchant_encoder.pkl"
 LOCATION_ENCODER_PATH = "app/model/location_encoder.pkl"
 
+# Raw upload columns preprocessing reads; everything else in a CSV is ignored
+INPUT_COLUMNS = frozenset(
+    ['Amount', 'Payment_Method', 'Merchant_Category', 'Location', 'Time'] + [f'V{i}' for i in range(1, 29)]
+)
+
+def is_input_column(name):
+    """Whether a CSV column feeds the model, either as raw input or a trained feature"""
+    return name in INPUT_COLUMNS or name in (feature_columns or ())
+
+# Parse uploads straight into typed columns: float32 amounts and categorical
+# codes for the string fields, so each distinct value is encoded only once
+CSV_READ_OPTS = dict(
+    dtype={
+        "Amount": "float32",
+        "Payment_Method": "category",
+        "Merchant_Category": "category",
+        "Location": "category",
+    },
+    engine="c",
+)
+
 try:
     model = joblib.load(MODEL_PATH)
     scaler = joblib.load(SCALER_PATH)
@@ -28,6 +49,19 @@ except Exception as e:
     merchant_encoder = None
     location_encoder = None
 
+def encode_column(encoder, column, default=0):
+    """
+    Label-encode a column through a class -> code lookup, so categorical columns
+    map each category once. Labels the encoder never saw (and missing values)
+    get the default code row by row, independent of the rest of the batch.
+    """
+    lookup = dict(zip(encoder.classes_, range(len(encoder.classes_))))
+    return column.map(lookup).astype("float64").fillna(default).astype("int64").to_numpy()
+
+def investigation_priority(prob):
+    """Police investigation priority for a fraud probability"""
+    return "HIGH" if prob > 0.7 else "MEDIUM" if prob > 0.3 else "LOW"
+
 def preprocess_indian_banking_features(data):
     """
     Preprocess data for Indian Banking fraud detection model
@@ -55,23 +89,23 @@ def preprocess_indian_banking_features(data):
     
     # Encode categorical features
     try:
-        df['Payment_Method_Encoded'] = payment_encoder.transform(df['Payment_Method'])
+        df['Payment_Method_Encoded'] = encode_column(payment_encoder, df['Payment_Method'])
     except:
         df['Payment_Method_Encoded'] = 0  # Default encoding
     
     try:
-        df['Merchant_Category_Encoded'] = merchant_encoder.transform(df['Merchant_Category'])
+        df['Merchant_Category_Encoded'] = encode_column(merchant_encoder, df['Merchant_Category'])
     except:
         df['Merchant_Category_Encoded'] = 0  # Default encoding
     
     try:
-        df['Location_Encoded'] = location_encoder.transform(df['Location'])
+        df['Location_Encoded'] = encode_column(location_encoder, df['Location'])
     except:
         df['Location_Encoded'] = 0  # Default encoding
     
     # Create time-based features
     if 'Time' in df.columns:
-        df['Hour'] = pd.to_datetime(df['Time']).dt.hour
+        df['Hour'] = pd.to_datetime(df['Time']).dt.hour.fillna(12)  # Rows without a time default to noon
     else:
         df['Hour'] = 12  # Default to noon
     
@@ -117,7 +151,7 @@ def predict_single(data):
                 "timestamp": pd.Timestamp.now().isoformat(),
                 "payment_method": data.get('Payment_Method', 'Unknown'),
                 "amount": data.get('Amount', 0),
-                "investigation_priority": "HIGH" if prob > 0.7 else "MEDIUM" if prob > 0.3 else "LOW",
+                "investigation_priority": investigation_priority(prob),
                 "recommendation": (
                     "Immediate investigation required - High fraud risk detected" if prob > 0.7 else
                     "Further verification recommended - Medium fraud risk" if prob > 0.3 else
@@ -128,31 +162,46 @@ def predict_single(data):
     except Exception as e:
         return {"error": f"Prediction failed: {str(e)}"}
 
-def predict_batch(file):
+def predict_batch(file, chunksize=50_000):
+    """Score an uploaded CSV file, or a DataFrame of transactions, in one batch"""
     if model is None or scaler is None:
         return {"error": "Model not loaded"}
     
     try:
-        df = pd.read_csv(file.file)
-        X_df = preprocess_indian_banking_features(df)
-        X_scaled = scaler.transform(X_df)
+        # Score uploads in chunks so only chunksize rows are parsed and preprocessed at a time
+        if isinstance(file, pd.DataFrame):
+            chunks = [file]
+        else:
+            # Skip columns the model never reads; if none match, keep them all so no rows are lost
+            header = pd.read_csv(file.file, nrows=0).columns
+            file.file.seek(0)
+            usecols = [col for col in header if is_input_column(col)] or None
+            chunks = pd.read_csv(file.file, chunksize=chunksize, usecols=usecols, **CSV_READ_OPTS)
         
-        probs = model.predict_proba(X_scaled)[:,1]
-        labels = probs > 0.5
-        
-        results = [
-            {
-                "transaction_id": i+1,
-                "is_fraud": bool(label),
-                "probability": float(prob)
-            }
-            for i, (label, prob) in enumerate(zip(labels, probs))
-        ]
+        results = []
+        fraudulent = 0
+        for df in chunks:
+            X_df = preprocess_indian_banking_features(df)
+            X_scaled = scaler.transform(X_df)
+            
+            probs = model.predict_proba(X_scaled)[:,1]
+            labels = probs > 0.5
+            fraudulent += int(labels.sum())
+            
+            results.extend(
+                {
+                    "transaction_id": i,
+                    "is_fraud": bool(label),
+                    "probability": float(prob),
+                    "investigation_priority": investigation_priority(prob)
+                }
+                for i, (label, prob) in enumerate(zip(labels, probs), start=len(results) + 1)
+            )
         
         summary = {
             "total": len(results),
-            "fraudulent": int(sum(labels)),
-            "legit": len(results) - int(sum(labels))
+            "fraudulent": fraudulent,
+            "legit": len(results) - fraudulent
         }
         
         return {"results": results, "summary": summary}
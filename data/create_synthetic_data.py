@@ -5,27 +5,30 @@ This replaces the need for Kaggle API credentials during development.
 import pandas as pd
 import numpy as np
 
+# Anonymized feature column names (V1-V28, as in the original Kaggle dataset)
+V_COLS = [f'V{i}' for i in range(1, 29)]
+
 def create_synthetic_dataset():
     # Set random seed for reproducibility
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     # Create 10,000 transactions
     n_samples = 10000
     
     # Generate features (V1-V28 like in the real dataset)
     features = {}
-    for i in range(1, 29):
-        features[f'V{i}'] = np.random.normal(0, 1, n_samples)
+    for col in V_COLS:
+        features[col] = rng.standard_normal(n_samples, dtype=np.float32)
     
     # Generate Time and Amount
-    features['Time'] = np.random.randint(0, 172800, n_samples)  # 48 hours in seconds
-    features['Amount'] = np.random.exponential(50, n_samples)  # Exponential distribution for amounts
+    features['Time'] = rng.integers(0, 172800, n_samples, dtype=np.int32)  # 48 hours in seconds
+    features['Amount'] = rng.exponential(50, n_samples).astype(np.float32)  # Exponential distribution for amounts
     
     # Create DataFrame
     df = pd.DataFrame(features)
     
     # Generate fraud labels (5% fraud rate)
-    df['Class'] = np.random.choice([0, 1], size=n_samples, p=[0.95, 0.05])
+    df['Class'] = rng.choice([0, 1], size=n_samples, p=[0.95, 0.05])
     
     # Make fraudulent transactions slightly different
     fraud_mask = df['Class'] == 1
@@ -36,6 +39,13 @@ def create_synthetic_dataset():
     print(f"Created synthetic dataset with {len(df)} transactions")
     print(f"Fraud rate: {df['Class'].mean():.2%}")
     print("Dataset saved as 'creditcard.csv'")
+    
+    # Columnar copy for faster downstream reads (requires pyarrow)
+    try:
+        df.to_parquet('creditcard.parquet', engine='pyarrow', compression='snappy', row_group_size=100_000)
+        print("Dataset saved as 'creditcard.parquet'")
+    except ImportError:
+        print("pyarrow not installed - skipping Parquet output")
 
 if __name__ == "__main__":
     create_synthetic_dataset()
@@ -1,19 +1,120 @@
 """
 Script to download Credit Card Fraud Detection dataset from Kaggle.
-Requires Kaggle API credentials (kaggle.json).
+Requires Kaggle API credentials (kaggle.json or KAGGLE_USERNAME/KAGGLE_KEY) and
+the requests package; the kaggle client package is no longer needed.
+
+The archive is streamed to a .part file with HTTP Range resume, so a dropped
+connection continues from the last byte written instead of starting over.
 """
+import json
 import os
-from kaggle.api.kaggle_api_extended import KaggleApi
+import shutil
+import zipfile
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+KAGGLE_DOWNLOAD_URL = "https://www.kaggle.com/api/v1/datasets/download/{dataset}"
+CHUNK_SIZE = 1 << 20  # 1 MiB
+
+def kaggle_credentials():
+    """Read Kaggle credentials from the environment or kaggle.json"""
+    if os.environ.get("KAGGLE_USERNAME") and os.environ.get("KAGGLE_KEY"):
+        return os.environ["KAGGLE_USERNAME"], os.environ["KAGGLE_KEY"]
+
+    config_dir = os.environ.get("KAGGLE_CONFIG_DIR", os.path.join(os.path.expanduser("~"), ".kaggle"))
+    with open(os.path.join(config_dir, "kaggle.json")) as f:
+        config = json.load(f)
+    return config["username"], config["key"]
+
+def create_session(auth):
+    """Create a pooled session that retries transient failures"""
+    session = requests.Session()
+    session.auth = auth
+    retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    return session
+
+def _total_size(response):
+    """Full archive size from a Content-Range ('bytes a-b/N' or 'bytes */N') or Content-Length header, if given"""
+    content_range = response.headers.get("Content-Range", "")
+    if "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+        return int(total) if total.isdigit() else None
+    if response.status_code == 200 and response.headers.get("Content-Length", "").isdigit():
+        return int(response.headers["Content-Length"])
+    return None
+
+def download_with_resume(session, url, part_path, max_attempts=5):
+    """
+    Stream url into part_path, resuming from its current size after connection errors.
+    The finished file is checked against the size the server reports; a .part left
+    over from an earlier run that doesn't match is discarded and fetched again.
+    """
+    for attempt in range(1, max_attempts + 1):
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        try:
+            with session.get(url, headers=headers, stream=True, timeout=(3.0, 60.0)) as response:
+                total = _total_size(response)
+                if response.status_code == 416:
+                    # Nothing past offset: done only if the server's size says the file is whole
+                    if total == offset:
+                        return
+                    print(f"Discarding stale partial download ({offset} bytes, server reports {total})")
+                    os.remove(part_path)
+                    continue
+                response.raise_for_status()
+
+                # 206 continues the partial file; a plain 200 means the server ignored Range
+                mode = "ab" if response.status_code == 206 else "wb"
+                with open(part_path, mode) as out:
+                    for block in response.iter_content(chunk_size=CHUNK_SIZE):
+                        out.write(block)
+
+            size = os.path.getsize(part_path)
+            if total is None or size == total:
+                return
+            if size > total:
+                print(f"Discarding oversized download ({size} bytes, expected {total})")
+                os.remove(part_path)
+            else:
+                print(f"Download ended early ({size}/{total} bytes), resuming...")
+        except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+            if attempt == max_attempts:
+                raise
+            print(f"Download interrupted ({e}), resuming (attempt {attempt + 1}/{max_attempts})...")
+    raise IOError(f"Could not download a complete copy of {url} in {max_attempts} attempts")
+
+def extract_zip(zip_path, download_path):
+    """Extract every member of zip_path into download_path with 1 MiB copies"""
+    with zipfile.ZipFile(zip_path) as zf:
+        root = os.path.realpath(download_path)
+        for info in zf.infolist():
+            target = os.path.realpath(os.path.join(root, info.filename))
+            if os.path.commonpath([root, target]) != root:
+                raise ValueError(f"Refusing to extract {info.filename!r} outside {download_path}")
+            if info.is_dir():
+                os.makedirs(target, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+            with zf.open(info) as src, open(target, "wb") as out:
+                shutil.copyfileobj(src, out, length=CHUNK_SIZE)
 
 def download_kaggle_dataset():
-    api = KaggleApi()
-    api.authenticate()
-    
     dataset = "mlg-ulb/creditcardfraud"
     download_path = "."
-    
+    zip_path = os.path.join(download_path, dataset.split("/")[-1] + ".zip")
+    part_path = zip_path + ".part"
+
     print(f"Downloading dataset: {dataset}")
-    api.dataset_download_files(dataset, path=download_path, unzip=True)
+    with create_session(kaggle_credentials()) as session:
+        download_with_resume(session, KAGGLE_DOWNLOAD_URL.format(dataset=dataset), part_path)
+    os.replace(part_path, zip_path)
+
+    extract_zip(zip_path, download_path)
+    os.remove(zip_path)
     print("Dataset downloaded successfully!")
 
 if __name__ == "__main__":
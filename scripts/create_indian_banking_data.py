@@ -7,130 +7,161 @@ Creates realistic Indian banking transaction patterns with:
 - Festival and seasonal spending patterns
 - RBI compliance indicators
 """
+import os
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 
-def create_indian_banking_dataset(n_samples=100000):
-    np.random.seed(42)
-    random.seed(42)
+# Indian Payment Methods
+PAYMENT_METHODS = [
+    'UPI', 'RTGS', 'NEFT', 'IMPS', 'Debit_Card', 'Credit_Card', 
+    'Net_Banking', 'Mobile_Banking', 'ATM_Withdrawal', 'Cash_Deposit'
+]
+
+# Payment methods favoured by fraudsters
+FRAUD_PAYMENT_METHODS = ['UPI', 'Net_Banking', 'Mobile_Banking', 'International_Card']
+
+# Indian Merchant Categories
+INDIAN_MERCHANTS = [
+    'Grocery_Kirana', 'Petrol_Pump', 'Restaurant_Dhaba', 'E_Commerce', 
+    'Mobile_Recharge', 'Electricity_Bill', 'Gas_Cylinder', 'Medical_Pharmacy',
+    'Gold_Jewellery', 'Clothing_Textile', 'Auto_Rickshaw', 'Train_Booking',
+    'Bus_Booking', 'Movie_Ticket', 'DTH_Recharge', 'Insurance_Premium',
+    'Mutual_Fund', 'Fixed_Deposit', 'Education_Fee', 'Temple_Donation'
+]
+
+# Indian States and Cities
+INDIAN_LOCATIONS = [
+    'Mumbai_Maharashtra', 'Delhi_NCR', 'Bangalore_Karnataka', 'Chennai_Tamil_Nadu',
+    'Kolkata_West_Bengal', 'Hyderabad_Telangana', 'Pune_Maharashtra', 'Ahmedabad_Gujarat',
+    'Jaipur_Rajasthan', 'Lucknow_Uttar_Pradesh', 'Kochi_Kerala', 'Indore_Madhya_Pradesh',
+    'Bhubaneswar_Odisha', 'Guwahati_Assam', 'Chandigarh_Punjab', 'Coimbatore_Tamil_Nadu'
+]
+
+# Suspicious locations (for fraud simulation)
+SUSPICIOUS_LOCATIONS = [
+    'International_Dubai', 'International_Singapore', 'International_USA',
+    'Border_Nepal', 'Border_Bangladesh', 'Unknown_Location'
+]
+
+# Indian Banking Hours (10 AM to 4 PM for traditional banking)
+BANKING_HOURS = list(range(10, 16))
+
+# Anonymized feature column names (V1-V28, as in the original Kaggle dataset)
+V_COLS = [f'V{i}' for i in range(1, 29)]
+
+# Rows per block when applying V-feature shifts (16k x 28 float32 ~ 1.75 MB, fits in L2)
+BLOCK_ROWS = 16_384
+
+# Festival dates (higher transaction volumes)
+FESTIVALS = [
+    datetime(2024, 3, 8),   # Holi
+    datetime(2024, 4, 17),  # Ram Navami
+    datetime(2024, 8, 19),  # Raksha Bandhan
+    datetime(2024, 10, 12), # Dussehra
+    datetime(2024, 11, 1),  # Diwali
+    datetime(2024, 12, 25), # Christmas
+]
+
+def create_indian_banking_dataset(n_samples=100000, chunk_size=50_000, max_workers=None):
+    """Create the full Indian banking dataset in memory"""
+    return pd.concat(iter_indian_banking_chunks(n_samples, chunk_size, max_workers), ignore_index=True)
+
+def iter_indian_banking_chunks(n_samples=100000, chunk_size=50_000, max_workers=None):
+    """
+    Yield the Indian banking dataset as DataFrames of at most chunk_size rows.
     
+    Chunks are generated in parallel across max_workers processes (default:
+    os.cpu_count()), each with its own stream spawned from one SeedSequence,
+    and yielded in order. Output depends only on n_samples and chunk_size.
+    """
     print("Creating Indian Banking Transaction Dataset...")
     
-    # Indian Payment Methods
-    payment_methods = [
-        'UPI', 'RTGS', 'NEFT', 'IMPS', 'Debit_Card', 'Credit_Card', 
-        'Net_Banking', 'Mobile_Banking', 'ATM_Withdrawal', 'Cash_Deposit'
-    ]
-    
-    # Indian Merchant Categories
-    indian_merchants = [
-        'Grocery_Kirana', 'Petrol_Pump', 'Restaurant_Dhaba', 'E_Commerce', 
-        'Mobile_Recharge', 'Electricity_Bill', 'Gas_Cylinder', 'Medical_Pharmacy',
-        'Gold_Jewellery', 'Clothing_Textile', 'Auto_Rickshaw', 'Train_Booking',
-        'Bus_Booking', 'Movie_Ticket', 'DTH_Recharge', 'Insurance_Premium',
-        'Mutual_Fund', 'Fixed_Deposit', 'Education_Fee', 'Temple_Donation'
-    ]
-    
-    # Indian States and Cities
-    indian_locations = [
-        'Mumbai_Maharashtra', 'Delhi_NCR', 'Bangalore_Karnataka', 'Chennai_Tamil_Nadu',
-        'Kolkata_West_Bengal', 'Hyderabad_Telangana', 'Pune_Maharashtra', 'Ahmedabad_Gujarat',
-        'Jaipur_Rajasthan', 'Lucknow_Uttar_Pradesh', 'Kochi_Kerala', 'Indore_Madhya_Pradesh',
-        'Bhubaneswar_Odisha', 'Guwahati_Assam', 'Chandigarh_Punjab', 'Coimbatore_Tamil_Nadu'
-    ]
-    
-    # Suspicious locations (for fraud simulation)
-    suspicious_locations = [
-        'International_Dubai', 'International_Singapore', 'International_USA',
-        'Border_Nepal', 'Border_Bangladesh', 'Unknown_Location'
-    ]
-    
-    # Indian Banking Hours (10 AM to 4 PM for traditional banking)
-    banking_hours = list(range(10, 16))
-    
-    # Festival dates (higher transaction volumes)
-    festivals = [
-        datetime(2024, 3, 8),   # Holi
-        datetime(2024, 4, 17),  # Ram Navami
-        datetime(2024, 8, 19),  # Raksha Bandhan
-        datetime(2024, 10, 12), # Dussehra
-        datetime(2024, 11, 1),  # Diwali
-        datetime(2024, 12, 25), # Christmas
-    ]
-    
-    # Initialize data containers
-    transactions = []
-    
-    for i in range(n_samples):
-        # Generate transaction timestamp
-        start_date = datetime(2024, 1, 1)
-        days_offset = random.randint(0, 365)
-        hour = np.random.choice(24, p=create_indian_hour_probability())
-        transaction_time = start_date + timedelta(days=days_offset, hours=hour)
-        
-        # Determine fraud probability based on Indian patterns
-        fraud_probability = calculate_indian_fraud_probability(
-            transaction_time, hour, festivals
-        )
-        
-        is_fraud = random.random() < fraud_probability
-        
-        # Select payment method
-        if is_fraud:
-            # Fraudsters prefer certain methods
-            payment_method = np.random.choice(
-                ['UPI', 'Net_Banking', 'Mobile_Banking', 'International_Card'],
-                p=[0.4, 0.3, 0.2, 0.1]
-            )
-        else:
-            payment_method = random.choice(payment_methods)
-        
-        # Select merchant category
-        merchant = random.choice(indian_merchants)
-        
-        # Generate transaction amount based on Indian patterns
-        amount = generate_indian_amount(merchant, is_fraud)
-        
-        # Select location
-        if is_fraud and random.random() < 0.3:
-            location = random.choice(suspicious_locations)
-        else:
-            location = random.choice(indian_locations)
-        
-        # Generate Indian-specific features
-        features = generate_indian_features(
-            payment_method, merchant, location, amount, 
-            transaction_time, is_fraud
-        )
-        
-        # Add transaction metadata
-        transaction = {
-            'Transaction_ID': f'TXN_{i+1:06d}',
-            'Timestamp': transaction_time,
-            'Amount': round(amount, 2),
-            'Payment_Method': payment_method,
-            'Merchant_Category': merchant,
-            'Location': location,
-            'Hour': transaction_time.hour,
-            'Day_of_Week': transaction_time.weekday(),
-            'Is_Festival_Season': is_near_festival(transaction_time, festivals),
-            'Is_Banking_Hours': hour in banking_hours,
-            'Is_Weekend': transaction_time.weekday() >= 5,
-            'Month': transaction_time.month,
-            'Class': 1 if is_fraud else 0
-        }
-        
-        # Add anonymized features (V1-V28 like original dataset)
-        transaction.update(features)
-        
-        transactions.append(transaction)
-        
-        if (i + 1) % 10000 == 0:
-            print(f"Generated {i+1} transactions...")
+    starts = range(0, n_samples, chunk_size)
+    seeds = np.random.SeedSequence(42).spawn(len(starts))
+    shards = [(seed, start, min(chunk_size, n_samples - start)) for seed, start in zip(seeds, starts)]
+    
+    if len(shards) == 1 or max_workers == 1:
+        chunks = map(generate_seeded_chunk, shards)
+        yield from report_progress(chunks, shards)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            chunks = executor.map(generate_seeded_chunk, shards)
+            yield from report_progress(chunks, shards)
+
+def report_progress(chunks, shards):
+    """Yield chunks, printing a running row count after each"""
+    for chunk, (_, start, size) in zip(chunks, shards):
+        yield chunk
+        print(f"Generated {start + size} transactions...")
+
+def generate_seeded_chunk(shard):
+    """Generate one (seed_sequence, start, n) shard with its own Generator"""
+    seed, start, n = shard
+    return generate_indian_banking_chunk(np.random.default_rng(seed), start, n)
+
+def generate_indian_banking_chunk(rng, start, n):
+    """Generate n transactions, numbering Transaction_IDs from start + 1"""
+    # Generate transaction timestamps
+    start_date = datetime(2024, 1, 1)
+    days_offset = rng.integers(0, 366, n)
+    hours = np.searchsorted(_HOUR_CDF, rng.random(n), side='right')  # Inverse-CDF sample
+    timestamps = (
+        pd.Timestamp(start_date)
+        + pd.to_timedelta(days_offset, unit='D')
+        + pd.to_timedelta(hours, unit='h')
+    )
+    weekdays = timestamps.dayofweek.to_numpy()
+    near_festival = is_near_festival(timestamps, FESTIVALS)
     
-    return pd.DataFrame(transactions)
+    # Determine fraud probability based on Indian patterns
+    fraud_probability = calculate_indian_fraud_probability(
+        hours, weekdays, timestamps.day.to_numpy(), near_festival
+    )
+    is_fraud = rng.random(n) < fraud_probability
+    
+    # Select payment method - fraudsters prefer certain methods
+    payment_method = np.where(
+        is_fraud,
+        rng.choice(FRAUD_PAYMENT_METHODS, size=n, p=[0.4, 0.3, 0.2, 0.1]),
+        rng.choice(PAYMENT_METHODS, size=n)
+    )
+    
+    # Select merchant category
+    merchants = rng.choice(INDIAN_MERCHANTS, size=n)
+    
+    # Generate transaction amount based on Indian patterns
+    amounts = generate_indian_amounts(rng, merchants, is_fraud)
+    
+    # Select location
+    locations = np.where(
+        is_fraud & (rng.random(n) < 0.3),
+        rng.choice(SUSPICIOUS_LOCATIONS, size=n),
+        rng.choice(INDIAN_LOCATIONS, size=n)
+    )
+    
+    # Generate Indian-specific anonymized features (V1-V28 like original dataset)
+    features = generate_indian_features(rng, locations, amounts, hours, is_fraud)
+    
+    df = pd.DataFrame({
+        'Transaction_ID': np.char.add('TXN_', np.char.zfill(np.arange(start + 1, start + n + 1).astype(str), 6)),
+        'Timestamp': timestamps,
+        'Amount': np.round(amounts, 2).astype(np.float32),
+        'Payment_Method': pd.Categorical(payment_method, categories=PAYMENT_METHODS + ['International_Card']),
+        'Merchant_Category': pd.Categorical(merchants, categories=INDIAN_MERCHANTS),
+        'Location': pd.Categorical(locations, categories=INDIAN_LOCATIONS + SUSPICIOUS_LOCATIONS),
+        'Hour': hours,
+        'Day_of_Week': weekdays,
+        'Is_Festival_Season': near_festival,
+        'Is_Banking_Hours': np.isin(hours, BANKING_HOURS),
+        'Is_Weekend': weekdays >= 5,
+        'Month': timestamps.month.to_numpy(),
+        'Class': is_fraud.astype(int)
+    })
+    
+    features_df = pd.DataFrame(features, columns=V_COLS)
+    return pd.concat([df, features_df], axis=1)
 
 def create_indian_hour_probability():
     """Indian transaction patterns - peak during business hours and evening"""
@@ -141,118 +172,192 @@ def create_indian_hour_probability():
     probs[0:6] = 0.01    # Night (very low)
     return probs / probs.sum()
 
-def calculate_indian_fraud_probability(transaction_time, hour, festivals):
-    """Calculate fraud probability based on Indian patterns"""
-    base_fraud_rate = 0.025  # 2.5% base fraud rate
+# Hour distribution is fixed, so build it (and its CDF) once at import
+_HOUR_PROBS = create_indian_hour_probability()
+_HOUR_CDF = np.cumsum(_HOUR_PROBS)
+_HOUR_CDF[-1] = 1.0  # Guard against rounding so every sample maps to hour <= 23
+
+def calculate_indian_fraud_probability(hours, weekdays, days_of_month, near_festival):
+    """Calculate fraud probability for each transaction based on Indian patterns"""
+    fraud_rate = np.full(len(hours), 0.025)  # 2.5% base fraud rate
     
     # Night transactions (higher risk)
-    if hour < 6 or hour > 23:
-        base_fraud_rate *= 3
+    fraud_rate[(hours < 6) | (hours > 23)] *= 3
     
     # Weekend transactions
-    if transaction_time.weekday() >= 5:
-        base_fraud_rate *= 1.5
+    fraud_rate[weekdays >= 5] *= 1.5
     
     # Festival season (higher fraud attempts)
-    if is_near_festival(transaction_time, festivals):
-        base_fraud_rate *= 2
+    fraud_rate[near_festival] *= 2
     
     # End of month (salary time - more fraud)
-    if transaction_time.day > 25:
-        base_fraud_rate *= 1.3
+    fraud_rate[days_of_month > 25] *= 1.3
     
-    return min(base_fraud_rate, 0.15)  # Cap at 15%
+    return np.minimum(fraud_rate, 0.15)  # Cap at 15%
 
-def is_near_festival(date, festivals):
-    """Check if date is within 7 days of any festival"""
-    for festival in festivals:
-        if abs((date - festival).days) <= 7:
-            return True
-    return False
+def is_near_festival(dates, festivals):
+    """Check which dates are within 7 days of any festival"""
+    festival_days = np.sort(np.array(festivals, dtype='datetime64[D]'))
+    days = pd.DatetimeIndex(dates).to_numpy().astype('datetime64[D]')
+    
+    # Nearest festival on either side of each date
+    idx = np.searchsorted(festival_days, days)
+    before = festival_days[np.clip(idx - 1, 0, len(festival_days) - 1)]
+    after = festival_days[np.clip(idx, 0, len(festival_days) - 1)]
+    nearest = np.minimum(np.abs(days - before), np.abs(days - after))
+    return nearest <= np.timedelta64(7, 'D')
 
-def generate_indian_amount(merchant, is_fraud):
-    """Generate realistic Indian transaction amounts"""
-    if is_fraud:
-        # Fraud patterns in India
-        if random.random() < 0.4:
-            return random.uniform(1, 100)  # Small test amounts
-        else:
-            return np.random.exponential(5000) + 1000  # Large fraud amounts
+def generate_indian_amounts(rng, merchants, is_fraud):
+    """Generate realistic Indian transaction amounts, one draw per merchant group"""
+    amounts = np.empty(len(merchants))
     
     # Normal transaction amounts by merchant type
     amount_patterns = {
-        'Grocery_Kirana': lambda: np.random.gamma(2, 150),        # ₹300 average
-        'Petrol_Pump': lambda: np.random.gamma(3, 200),          # ₹600 average
-        'Mobile_Recharge': lambda: random.choice([199, 399, 599, 999]),
-        'Electricity_Bill': lambda: np.random.gamma(2, 400),      # ₹800 average
-        'E_Commerce': lambda: np.random.exponential(800) + 200,   # ₹1000 average
-        'Gold_Jewellery': lambda: np.random.exponential(15000) + 5000,  # High value
-        'Auto_Rickshaw': lambda: random.uniform(50, 300),      # ₹50-300
-        'Train_Booking': lambda: random.choice([150, 300, 500, 1200, 2500]),
-        'Movie_Ticket': lambda: random.choice([120, 180, 250, 350]),
-        'DTH_Recharge': lambda: random.choice([199, 299, 499, 799]),
+        'Grocery_Kirana': lambda k: rng.gamma(2, 150, k),        # ₹300 average
+        'Petrol_Pump': lambda k: rng.gamma(3, 200, k),          # ₹600 average
+        'Mobile_Recharge': lambda k: rng.choice([199, 399, 599, 999], k),
+        'Electricity_Bill': lambda k: rng.gamma(2, 400, k),      # ₹800 average
+        'E_Commerce': lambda k: rng.exponential(800, k) + 200,   # ₹1000 average
+        'Gold_Jewellery': lambda k: rng.exponential(15000, k) + 5000,  # High value
+        'Auto_Rickshaw': lambda k: rng.uniform(50, 300, k),      # ₹50-300
+        'Train_Booking': lambda k: rng.choice([150, 300, 500, 1200, 2500], k),
+        'Movie_Ticket': lambda k: rng.choice([120, 180, 250, 350], k),
+        'DTH_Recharge': lambda k: rng.choice([199, 299, 499, 799], k),
     }
     
-    if merchant in amount_patterns:
-        return amount_patterns[merchant]()
-    else:
-        return np.random.exponential(500) + 50
+    normal = ~is_fraud
+    other = normal.copy()
+    for merchant, draw in amount_patterns.items():
+        mask = normal & (merchants == merchant)
+        amounts[mask] = draw(mask.sum())
+        other &= ~mask
+    amounts[other] = rng.exponential(500, other.sum()) + 50
+    
+    # Fraud patterns in India
+    test_amount = is_fraud & (rng.random(len(merchants)) < 0.4)
+    large_amount = is_fraud & ~test_amount
+    amounts[test_amount] = rng.uniform(1, 100, test_amount.sum())  # Small test amounts
+    amounts[large_amount] = rng.exponential(5000, large_amount.sum()) + 1000  # Large fraud amounts
+    
+    return amounts
 
-def generate_indian_features(payment_method, merchant, location, amount, time, is_fraud):
+def generate_indian_features(rng, locations, amounts, hours, is_fraud):
     """Generate Indian banking specific anonymized features"""
-    features = {}
-    
-    # Generate V1-V28 features with Indian banking characteristics
-    for i in range(1, 29):
-        if is_fraud:
-            # Fraudulent transactions have different patterns
-            if i <= 10:  # Payment method related features
-                if 'International' in location:
-                    features[f'V{i}'] = np.random.normal(2.0, 1.5)
-                else:
-                    features[f'V{i}'] = np.random.normal(1.0, 1.2)
-            elif i <= 20:  # Amount and time related features
-                if amount > 10000:  # High value transactions
-                    features[f'V{i}'] = np.random.normal(-1.5, 1.0)
-                else:
-                    features[f'V{i}'] = np.random.normal(0.5, 1.0)
-            else:  # Location and behavioral features
-                if time.hour < 6 or time.hour > 22:  # Night transactions
-                    features[f'V{i}'] = np.random.normal(-2.0, 1.0)
-                else:
-                    features[f'V{i}'] = np.random.normal(0, 1.0)
-        else:
-            # Normal transactions
-            features[f'V{i}'] = np.random.normal(0, 1.0)
+    n = len(is_fraud)
+    
+    # Normal transactions
+    features = rng.standard_normal((n, 28), dtype=np.float32)
+    
+    # Fraudulent transactions have different patterns
+    international = is_fraud & (np.char.find(locations.astype(str), 'International') >= 0)
+    domestic = is_fraud & ~international
+    high_value = is_fraud & (amounts > 10000)
+    low_value = is_fraud & ~high_value
+    night = is_fraud & ((hours < 6) | (hours > 22))
+    
+    # Apply the shifts in L2-sized row blocks so each block's writes stay in cache
+    for start in range(0, n, BLOCK_ROWS):
+        rows = slice(start, start + BLOCK_ROWS)
+        block = features[rows]
+        
+        # Payment method related features (V1-V10)
+        shift_features(rng, block, international[rows], slice(0, 10), 2.0, 1.5)
+        shift_features(rng, block, domestic[rows], slice(0, 10), 1.0, 1.2)
+        
+        # Amount and time related features (V11-V20)
+        shift_features(rng, block, high_value[rows], slice(10, 20), -1.5, 1.0)
+        shift_features(rng, block, low_value[rows], slice(10, 20), 0.5, 1.0)
+        
+        # Location and behavioral features (V21-V28) - night transactions
+        shift_features(rng, block, night[rows], slice(20, 28), -2.0, 1.0)
     
     return features
 
+def shift_features(rng, block, mask, cols, mean, std):
+    """Redraw block[mask, cols] from N(mean, std) in float32"""
+    k = np.count_nonzero(mask)
+    if k:
+        width = cols.stop - cols.start
+        block[mask, cols] = rng.standard_normal((k, width), dtype=np.float32) * np.float32(std) + np.float32(mean)
+
+def write_chunks(chunks, name):
+    """
+    Write chunks to <name>.csv and, when pyarrow is installed, to a
+    Snappy-compressed <name>.parquet. Yields each chunk after it is written.
+    
+    With pyarrow the CSV goes through its multithreaded C++ writer, reusing the
+    Arrow table built for Parquet; otherwise it falls back to DataFrame.to_csv.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+        import pyarrow.parquet as pq
+    except ImportError:
+        pa = pacsv = pq = None
+        print("pyarrow not installed - skipping Parquet output")
+    
+    csv_writer = parquet_writer = None
+    try:
+        with open(f'{name}.csv', 'wb') as f:
+            for i, chunk in enumerate(chunks):
+                if pa is None:
+                    f.write(chunk.to_csv(header=(i == 0), index=False).encode())
+                else:
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                    if csv_writer is None:
+                        csv_writer = pacsv.CSVWriter(f, table.schema, write_options=pacsv.WriteOptions(batch_size=50_000))
+                        parquet_writer = pq.ParquetWriter(f'{name}.parquet', table.schema, compression='snappy')
+                    csv_writer.write_table(table)
+                    parquet_writer.write_table(table, row_group_size=100_000)
+                
+                yield chunk
+            
+            if csv_writer is not None:
+                csv_writer.close()
+    finally:
+        if parquet_writer is not None:
+            parquet_writer.close()
+
 if __name__ == "__main__":
-    # Create Indian banking dataset
+    # Create Indian banking dataset, streaming each chunk straight to CSV (and Parquet)
     print("🇮🇳 Creating Indian Banking Fraud Detection Dataset...")
-    df = create_indian_banking_dataset(100000)
+    amount_total = 0.0
+    group_stats = []
+    
+    chunks = write_chunks(iter_indian_banking_chunks(100000), 'indian_banking_transactions')
+    for i, chunk in enumerate(chunks):
+        if i == 0:
+            sample = chunk.head(10)
+        amount_total += chunk['Amount'].sum()
+        # One pass per chunk; every distribution below is a marginal of this
+        group_stats.append(
+            chunk.groupby(['Payment_Method', 'Merchant_Category', 'Location'], observed=True)['Class']
+            .agg(['count', 'sum'])
+        )
     
-    # Save dataset
-    df.to_csv('indian_banking_transactions.csv', index=False)
+    stats = pd.concat(group_stats).groupby(level=[0, 1, 2], observed=True).sum()
+    total, fraud_cases = stats['count'].sum(), stats['sum'].sum()
     
-    print(f"\n✅ Created Indian banking dataset with {len(df)} transactions")
-    print(f"📊 Fraud rate: {df['Class'].mean():.3%}")
-    print(f"💰 Average transaction amount: ₹{df['Amount'].mean():.2f}")
-    print(f"🚨 Fraud cases: {df['Class'].sum()}")
+    print(f"\n✅ Created Indian banking dataset with {total} transactions")
+    print(f"📊 Fraud rate: {fraud_cases / total:.3%}")
+    print(f"💰 Average transaction amount: ₹{amount_total / total:.2f}")
+    print(f"🚨 Fraud cases: {fraud_cases}")
     
     print("\n📱 Payment Method Distribution:")
-    print(df['Payment_Method'].value_counts())
+    print(stats['count'].groupby(level=0, observed=True).sum().sort_values(ascending=False))
     
     print("\n🏪 Top Merchant Categories:")
-    print(df['Merchant_Category'].value_counts().head(10))
+    print(stats['count'].groupby(level=1, observed=True).sum().sort_values(ascending=False).head(10))
     
     print("\n🌍 Location Distribution:")
-    print(df['Location'].value_counts().head(10))
+    print(stats['count'].groupby(level=2, observed=True).sum().sort_values(ascending=False).head(10))
     
     print("\n📈 Fraud by Payment Method:")
-    fraud_by_method = df.groupby('Payment_Method')['Class'].agg(['count', 'sum', 'mean']).round(3)
+    fraud_by_method = stats.groupby(level=0, observed=True).sum()
+    fraud_by_method['mean'] = fraud_by_method['sum'] / fraud_by_method['count']
+    fraud_by_method = fraud_by_method.round(3)
     fraud_by_method.columns = ['Total', 'Fraud_Cases', 'Fraud_Rate']
     print(fraud_by_method.sort_values('Fraud_Rate', ascending=False))
     
     print("\n🎉 Sample transactions:")
-    print(df[['Transaction_ID', 'Amount', 'Payment_Method', 'Merchant_Category', 'Location', 'Class']].head(10))
+    print(sample[['Transaction_ID', 'Amount', 'Payment_Method', 'Merchant_Category', 'Location', 'Class']])
@@ -4,20 +4,31 @@ This simulates real-world banking patterns and fraud indicators
 """
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 
-def create_realistic_transactions(n_samples=50000):
-    np.random.seed(42)
+# Anonymized feature column names (V1-V28, as in the original Kaggle dataset)
+V_COLS = [f'V{i}' for i in range(1, 29)]
+
+# Rows per block when applying V-feature shifts (16k x 28 float32 ~ 1.75 MB, fits in L2)
+BLOCK_ROWS = 16_384
+
+def create_realistic_transactions(n_samples=50000, chunk_size=50_000):
+    """Create the full realistic dataset in memory"""
+    return pd.concat(iter_realistic_chunks(n_samples, chunk_size), ignore_index=True)
+
+def iter_realistic_chunks(n_samples=50000, chunk_size=50_000):
+    """Yield the realistic dataset as DataFrames of at most chunk_size rows"""
+    rng = np.random.default_rng(42)
     
     print("Creating realistic banking transaction dataset...")
     
+    for start in range(0, n_samples, chunk_size):
+        yield generate_realistic_chunk(rng, min(chunk_size, n_samples - start))
+
+def generate_realistic_chunk(rng, n_samples):
+    """Generate n_samples realistic transactions"""
     # Time patterns (business hours, weekends, holidays)
     start_date = datetime(2024, 1, 1)
-    dates = []
-    amounts = []
-    merchants = []
-    locations = []
-    fraud_labels = []
     
     # Merchant categories
     merchant_types = [
@@ -30,86 +41,79 @@ def create_realistic_transactions(n_samples=50000):
     home_locations = ['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix']
     foreign_locations = ['London', 'Tokyo', 'Paris', 'Dubai', 'Sydney']
     
-    features = {}
-    for i in range(1, 29):
-        features[f'V{i}'] = []
-    
-    for i in range(n_samples):
-        # Time patterns
-        days_offset = int(np.random.randint(0, 365))
-        hour = int(np.random.choice(range(24), p=create_hour_probability()))
-        transaction_time = start_date + timedelta(days=days_offset, hours=hour)
-        
-        # Determine if fraud (5% base rate, higher at night/weekends)
-        fraud_probability = 0.02  # Base 2%
-        if hour < 6 or hour > 22:  # Night transactions more risky
-            fraud_probability *= 3
-        if transaction_time.weekday() >= 5:  # Weekend slightly more risky
-            fraud_probability *= 1.5
-            
-        is_fraud = np.random.random() < fraud_probability
-        
-        # Amount patterns
-        if is_fraud:
-            # Fraudulent transactions: often very small (testing) or very large
-            if np.random.random() < 0.3:
-                amount = np.random.uniform(1, 10)  # Small test amounts
-            else:
-                amount = np.random.exponential(500) + 100  # Large amounts
-        else:
-            # Normal transactions follow different patterns by merchant
-            merchant = np.random.choice(merchant_types)
-            if merchant == 'Grocery Store':
-                amount = np.random.gamma(2, 30)  # $60 average
-            elif merchant == 'Gas Station':
-                amount = np.random.gamma(3, 15)  # $45 average
-            elif merchant == 'Restaurant':
-                amount = np.random.gamma(2, 20)  # $40 average
-            elif merchant == 'ATM Withdrawal':
-                amount = np.random.choice([20, 40, 60, 80, 100, 200])
-            else:
-                amount = np.random.exponential(50) + 5
-        
-        # Location patterns
-        if is_fraud and np.random.random() < 0.4:
-            location = np.random.choice(foreign_locations)  # Fraud often from unusual locations
-        else:
-            location = np.random.choice(home_locations)
-        
-        # Feature engineering (V1-V28) - these represent anonymized transaction features
-        for j in range(1, 29):
-            if is_fraud:
-                # Fraudulent transactions have different statistical patterns
-                if j <= 10:
-                    features[f'V{j}'].append(np.random.normal(0.5, 1.5))  # Shifted mean
-                else:
-                    features[f'V{j}'].append(np.random.normal(-0.3, 1.2))
-            else:
-                # Normal transactions
-                features[f'V{j}'].append(np.random.normal(0, 1))
-        
-        dates.append(transaction_time)
-        amounts.append(min(amount, 25000))  # Cap at $25K
-        merchants.append(merchant)
-        locations.append(location)
-        fraud_labels.append(1 if is_fraud else 0)
+    # Time patterns
+    days_offset = rng.integers(0, 365, n_samples)
+    hours = np.searchsorted(_HOUR_CDF, rng.random(n_samples), side='right')
+    weekdays = (start_date.weekday() + days_offset) % 7
+    
+    # Determine if fraud (5% base rate, higher at night/weekends)
+    fraud_probability = np.full(n_samples, 0.02)  # Base 2%
+    fraud_probability[(hours < 6) | (hours > 22)] *= 3  # Night transactions more risky
+    fraud_probability[weekdays >= 5] *= 1.5  # Weekend slightly more risky
+    is_fraud = rng.random(n_samples) < fraud_probability
+    
+    merchants = rng.choice(merchant_types, size=n_samples)
+    amounts = generate_realistic_amounts(rng, merchants, is_fraud)
+    
+    # Location patterns - fraud often from unusual locations
+    locations = np.where(
+        is_fraud & (rng.random(n_samples) < 0.4),
+        rng.choice(foreign_locations, size=n_samples),
+        rng.choice(home_locations, size=n_samples)
+    )
+    
+    # Feature engineering (V1-V28) - these represent anonymized transaction features
+    features = rng.standard_normal((n_samples, 28), dtype=np.float32)  # Normal transactions
+    
+    # Fraudulent transactions have different statistical patterns, applied in
+    # L2-sized row blocks so each block's writes stay in cache
+    for start in range(0, n_samples, BLOCK_ROWS):
+        rows = slice(start, start + BLOCK_ROWS)
+        block, fraud = features[rows], is_fraud[rows]
+        n_fraud = np.count_nonzero(fraud)
+        block[fraud, :10] = rng.standard_normal((n_fraud, 10), dtype=np.float32) * np.float32(1.5) + np.float32(0.5)  # Shifted mean
+        block[fraud, 10:] = rng.standard_normal((n_fraud, 18), dtype=np.float32) * np.float32(1.2) - np.float32(0.3)
     
     # Create DataFrame
-    df = pd.DataFrame(features)
-    df['Time'] = [(d - start_date).total_seconds() for d in dates]
-    df['Amount'] = amounts
-    df['Merchant_Type'] = merchants
-    df['Location'] = locations
-    df['Class'] = fraud_labels
+    df = pd.DataFrame(features, columns=V_COLS)
+    df['Time'] = (days_offset * 86400 + hours * 3600).astype(np.int32)
+    df['Amount'] = amounts.astype(np.float32)
+    df['Merchant_Type'] = pd.Categorical(merchants, categories=merchant_types)
+    df['Location'] = pd.Categorical(locations, categories=home_locations + foreign_locations)
+    df['Class'] = is_fraud.astype(int)
     
     # Add derived features that banks actually use
-    df['Hour'] = [d.hour for d in dates]
-    df['Day_of_Week'] = [d.weekday() for d in dates]
+    df['Hour'] = hours
+    df['Day_of_Week'] = weekdays
     df['Is_Weekend'] = df['Day_of_Week'] >= 5
     df['Is_Night'] = (df['Hour'] < 6) | (df['Hour'] > 22)
     
     return df
 
+def generate_realistic_amounts(rng, merchants, is_fraud):
+    """Generate transaction amounts, one draw per merchant group"""
+    n = len(merchants)
+    
+    # Normal transactions follow different patterns by merchant
+    amounts = rng.exponential(50, n) + 5
+    merchant_amounts = {
+        'Grocery Store': lambda k: rng.gamma(2, 30, k),    # $60 average
+        'Gas Station': lambda k: rng.gamma(3, 15, k),      # $45 average
+        'Restaurant': lambda k: rng.gamma(2, 20, k),       # $40 average
+        'ATM Withdrawal': lambda k: rng.choice([20, 40, 60, 80, 100, 200], k),
+    }
+    for merchant, draw in merchant_amounts.items():
+        mask = ~is_fraud & (merchants == merchant)
+        amounts[mask] = draw(mask.sum())
+    
+    # Fraudulent transactions: often very small (testing) or very large
+    test_amount = is_fraud & (rng.random(n) < 0.3)
+    large_amount = is_fraud & ~test_amount
+    amounts[test_amount] = rng.uniform(1, 10, test_amount.sum())  # Small test amounts
+    amounts[large_amount] = rng.exponential(500, large_amount.sum()) + 100  # Large amounts
+    
+    return np.minimum(amounts, 25000)  # Cap at $25K
+
 def create_hour_probability():
     # More transactions during business hours
     probs = np.ones(24) * 0.02  # Base probability
@@ -118,18 +122,69 @@ def create_hour_probability():
     probs[17:19] = 0.08  # Evening peak
     return probs / probs.sum()
 
+# Hour distribution is fixed, so build it (and its CDF) once at import
+_HOUR_PROBS = create_hour_probability()
+_HOUR_CDF = np.cumsum(_HOUR_PROBS)
+_HOUR_CDF[-1] = 1.0  # Guard against rounding so every sample maps to hour <= 23
+
+def write_chunks(chunks, name):
+    """
+    Write chunks to <name>.csv and, when pyarrow is installed, to a
+    Snappy-compressed <name>.parquet. Yields each chunk after it is written.
+    
+    With pyarrow the CSV goes through its multithreaded C++ writer, reusing the
+    Arrow table built for Parquet; otherwise it falls back to DataFrame.to_csv.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+        import pyarrow.parquet as pq
+    except ImportError:
+        pa = pacsv = pq = None
+        print("pyarrow not installed - skipping Parquet output")
+    
+    csv_writer = parquet_writer = None
+    try:
+        with open(f'{name}.csv', 'wb') as f:
+            for i, chunk in enumerate(chunks):
+                if pa is None:
+                    f.write(chunk.to_csv(header=(i == 0), index=False).encode())
+                else:
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                    if csv_writer is None:
+                        csv_writer = pacsv.CSVWriter(f, table.schema, write_options=pacsv.WriteOptions(batch_size=50_000))
+                        parquet_writer = pq.ParquetWriter(f'{name}.parquet', table.schema, compression='snappy')
+                    csv_writer.write_table(table)
+                    parquet_writer.write_table(table, row_group_size=100_000)
+                
+                yield chunk
+            
+            if csv_writer is not None:
+                csv_writer.close()
+    finally:
+        if parquet_writer is not None:
+            parquet_writer.close()
+
 if __name__ == "__main__":
-    # Create realistic dataset
-    df = create_realistic_transactions(50000)
+    # Create realistic dataset, streaming each chunk straight to CSV (and Parquet)
+    total = fraud_cases = 0
+    amount_total = 0.0
+    merchant_counts = []
     
-    # Save dataset
-    df.to_csv('realistic_transactions.csv', index=False)
+    chunks = write_chunks(iter_realistic_chunks(50000), 'realistic_transactions')
+    for i, chunk in enumerate(chunks):
+        if i == 0:
+            sample = chunk.head()
+        total += len(chunk)
+        fraud_cases += chunk['Class'].sum()
+        amount_total += chunk['Amount'].sum()
+        merchant_counts.append(chunk['Merchant_Type'].value_counts())
     
-    print(f"Created realistic dataset with {len(df)} transactions")
-    print(f"Fraud rate: {df['Class'].mean():.3%}")
-    print(f"Average transaction amount: ${df['Amount'].mean():.2f}")
-    print(f"Fraud cases: {df['Class'].sum()}")
+    print(f"Created realistic dataset with {total} transactions")
+    print(f"Fraud rate: {fraud_cases / total:.3%}")
+    print(f"Average transaction amount: ${amount_total / total:.2f}")
+    print(f"Fraud cases: {fraud_cases}")
     print("\nMerchant distribution:")
-    print(df['Merchant_Type'].value_counts())
+    print(pd.concat(merchant_counts).groupby(level=0).sum().sort_values(ascending=False))
     print("\nSample data:")
-    print(df.head())
+    print(sample)
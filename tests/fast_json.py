@@ -0,0 +1,23 @@
+"""
+JSON helpers shared by the test scripts: orjson's C parser/encoder for request
+and response bodies when it is installed, the standard library otherwise.
+"""
+
+import json
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(obj, sort_keys=False):
+        """Encode obj as compact JSON bytes; sort_keys gives a canonical form usable as a cache key"""
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+except ImportError:
+    loads = json.loads
+
+    def dumps(obj, sort_keys=False):
+        """Encode obj as compact JSON bytes; sort_keys gives a canonical form usable as a cache key"""
+        return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":")).encode()
@@ -1,47 +1,69 @@
-import requests
+import importlib.util
+import httpx
 import json
+from fast_json import JSON_HEADERS, dumps, loads
+
+API_BASE = "http://localhost:8000"
+
+# HTTP/2 is negotiated when the optional h2 package is installed and the server offers it
+def _new_client():
+    """One persistent client so every request in a run reuses its connections"""
+    return httpx.Client(
+        base_url=API_BASE,
+        timeout=5.0,
+        transport=httpx.HTTPTransport(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+            retries=2,  # Retry failed connects
+        ),
+    )
+
+# Sample transaction data (matching the dataset features)
+SAMPLE_TRANSACTION = {
+    "V1": -1.3598071336738,
+    "V2": -0.0727811733098497,
+    "V3": 2.53634673796914,
+    "V4": 1.37815522427443,
+    "V5": -0.338320769942518,
+    "V6": 0.462387777762292,
+    "V7": 0.239598554061257,
+    "V8": 0.0986979012610507,
+    "V9": 0.363786969611213,
+    "V10": 0.0907941719789316,
+    "V11": -0.551599533260813,
+    "V12": -0.617800855762348,
+    "V13": -0.991389847235408,
+    "V14": -0.311169353699879,
+    "V15": 1.46817697209427,
+    "V16": -0.470400525259478,
+    "V17": 0.207971241929242,
+    "V18": 0.0257905801985591,
+    "V19": 0.403992960255733,
+    "V20": 0.251412098239705,
+    "V21": -0.018306777944153,
+    "V22": 0.277837575558899,
+    "V23": -0.110473910188767,
+    "V24": 0.0669280749146731,
+    "V25": 0.128539358273528,
+    "V26": -0.189114843888824,
+    "V27": 0.133558376740387,
+    "V28": -0.0210530534538215,
+    "Time": 0,
+    "Amount": 149.62
+}
+
+# Serialize the fixed payload once instead of on every request
+_PAYLOAD = dumps(SAMPLE_TRANSACTION)
 
 # Test single prediction
-def test_single_prediction():
-    url = "http://localhost:8000/predict"
-    
-    # Sample transaction data (matching the dataset features)
-    data = {
-        "V1": -1.3598071336738,
-        "V2": -0.0727811733098497,
-        "V3": 2.53634673796914,
-        "V4": 1.37815522427443,
-        "V5": -0.338320769942518,
-        "V6": 0.462387777762292,
-        "V7": 0.239598554061257,
-        "V8": 0.0986979012610507,
-        "V9": 0.363786969611213,
-        "V10": 0.0907941719789316,
-        "V11": -0.551599533260813,
-        "V12": -0.617800855762348,
-        "V13": -0.991389847235408,
-        "V14": -0.311169353699879,
-        "V15": 1.46817697209427,
-        "V16": -0.470400525259478,
-        "V17": 0.207971241929242,
-        "V18": 0.0257905801985591,
-        "V19": 0.403992960255733,
-        "V20": 0.251412098239705,
-        "V21": -0.018306777944153,
-        "V22": 0.277837575558899,
-        "V23": -0.110473910188767,
-        "V24": 0.0669280749146731,
-        "V25": 0.128539358273528,
-        "V26": -0.189114843888824,
-        "V27": 0.133558376740387,
-        "V28": -0.0210530534538215,
-        "Time": 0,
-        "Amount": 149.62
-    }
-    
+def test_single_prediction(client=None):
     try:
-        response = requests.post(url, json=data)
-        result = response.json()
+        if client is None:
+            with _new_client() as client:
+                response = client.post("/predict", content=_PAYLOAD, headers=JSON_HEADERS)
+        else:
+            response = client.post("/predict", content=_PAYLOAD, headers=JSON_HEADERS)
+        result = loads(response.content)
         print("Single Prediction Result:")
         print(json.dumps(result, indent=2))
         return True
@@ -51,4 +73,5 @@ def test_single_prediction():
 
 if __name__ == "__main__":
     print("Testing Fraud Detection API...")
-    test_single_prediction()
+    with _new_client() as client:
+        test_single_prediction(client)